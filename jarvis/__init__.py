@@ -10,13 +10,28 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .core.assistant import JarvisAssistant
-from .core.config import Config
-from .platforms.detector import PlatformDetector
-
 __all__ = [
     "JarvisAssistant",
     "Config",
     "PlatformDetector",
     "__version__",
 ]
+
+# Lazy re-exports (PEP 562): importing the package stays cheap, and the
+# elevenlabs/numpy import chain is only paid when the assistant classes
+# are actually used.
+_EXPORTS = {
+    "JarvisAssistant": ("jarvis.core.assistant", "JarvisAssistant"),
+    "Config": ("jarvis.core.config", "Config"),
+    "PlatformDetector": ("jarvis.platforms.detector", "PlatformDetector"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), attr)
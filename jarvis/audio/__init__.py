@@ -1,11 +1,31 @@
 """Audio interface modules for Jarvis."""
 
-from .interruptible import InterruptibleAudioInterface
-from .volume_reducing import VolumeReducingAudioInterface
-from .silero_vad import SileroVADAudioInterface
-
 __all__ = [
     "InterruptibleAudioInterface",
     "VolumeReducingAudioInterface",
     "SileroVADAudioInterface",
 ]
+
+_MODULE_BY_NAME = {
+    "InterruptibleAudioInterface": ".interruptible",
+    "VolumeReducingAudioInterface": ".volume_reducing",
+    "SileroVADAudioInterface": ".silero_vad",
+}
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the audio interfaces (PEP 562).
+
+    Importing the package stays cheap: the VAD stack (torch/onnxruntime)
+    and numpy are only loaded when the corresponding interface is first
+    touched, which matters for CLI startup on Raspberry Pi.
+    """
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,313 @@
+"""
+Shared PyAudio machinery for the audio interfaces.
+
+InterruptibleAudioInterface and SileroVADAudioInterface used to carry
+near-identical copies of the stream lifecycle, ring-buffered playback
+and callback glue; this base class holds the single copy. Subclasses
+hook the mic path via _handle_input and the playback path via
+_process_output_chunk.
+"""
+
+import threading
+import platform
+import os
+from typing import Callable, Optional
+
+from elevenlabs.conversational_ai.conversation import AudioInterface
+
+from ._log import log
+from ._ring import AudioRing
+
+# Ring capacity in chunks: roughly two seconds of agent audio at 16kHz.
+# Bounding the backlog keeps worst-case interrupt latency and memory flat
+# when TTS streams faster than playback; excess chunks are dropped.
+OUTPUT_RING_CHUNKS = 32
+
+# The platform cannot change while the process runs, so the uname() call
+# behind platform.system() is paid once at import instead of per instance.
+_IS_MACOS = platform.system().lower() == "darwin"
+
+
+class _BasePyAudioInterface(AudioInterface):
+    """
+    Common PyAudio-backed audio interface plumbing.
+
+    Owns the stream lifecycle, the lock-free playback ring drained by a
+    callback-mode output stream, and interrupt/clear semantics. Worker
+    threads and per-chunk processing are left to subclass hooks.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        input_frames: int = 2048,
+        output_frames: int = 1024,
+    ):
+        """
+        Initialize the audio interface.
+
+        Args:
+            sample_rate: Audio sample rate in Hz
+            input_frames: Input buffer size in frames
+            output_frames: Output buffer size in frames
+        """
+        try:
+            import pyaudio
+        except ImportError as e:
+            raise ImportError(
+                f"PyAudio is required for {type(self).__name__}. "
+                "Install with: pip install pyaudio"
+            ) from e
+
+        self.pyaudio = pyaudio
+        self.sample_rate = sample_rate
+        self.input_frames = input_frames
+        self.output_frames = output_frames
+
+        self.is_macos = _IS_MACOS
+        self.p: Optional[pyaudio.PyAudio] = None
+        self.in_stream = None
+        self.out_stream = None
+        self.should_stop = threading.Event()
+        self.output_ring: Optional[AudioRing] = None
+        self.input_callback: Optional[Callable[[bytes], None]] = None
+        self._is_playing = False
+        # Leftover bytes from a chunk only partially consumed by the
+        # output callback; owned by the callback thread.
+        self._pending = b""
+        # Set by interrupt() to ask the callback to discard _pending;
+        # interrupt threads must not write callback-owned state directly.
+        self._drop_pending = False
+
+        # macOS-specific environment variable to help with audio issues
+        if self.is_macos:
+            os.environ["PYAUDIO_USE_COREAUDIO"] = "1"
+
+    def start(self, input_callback: Callable[[bytes], None]) -> None:
+        """
+        Start the audio interface.
+
+        Args:
+            input_callback: Callback function to handle input audio chunks
+
+        Raises:
+            RuntimeError: If audio interface fails to start
+        """
+        self.input_callback = input_callback
+
+        # Audio output is buffered in the ring so we can handle
+        # interruptions; the output stream pulls from it via its callback.
+        self.output_ring = AudioRing(capacity=OUTPUT_RING_CHUNKS)
+        self._pending = b""
+        self._drop_pending = False
+        self.should_stop.clear()
+        self._prepare_workers()
+
+        # Initialize PyAudio once and keep the handle across start/stop
+        # cycles; allocating a host-API handle takes tens of milliseconds
+        # and does not belong on the session-restart path.
+        if self.p is None:
+            try:
+                self.p = self.pyaudio.PyAudio()
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize PyAudio: {e}") from e
+
+        try:
+            # Create input stream
+            self.in_stream = self.p.open(
+                format=self.pyaudio.paInt16,
+                channels=1,
+                rate=self.sample_rate,
+                input=True,
+                stream_callback=self._input_callback,
+                frames_per_buffer=self.input_frames,
+                start=True,
+            )
+
+            # Create output stream in callback mode: PortAudio pulls
+            # audio from the ring on its own realtime thread, avoiding the
+            # extra buffering and scheduling jitter of blocking writes
+            self.out_stream = self.p.open(
+                format=self.pyaudio.paInt16,
+                channels=1,
+                rate=self.sample_rate,
+                output=True,
+                stream_callback=self._output_callback,
+                frames_per_buffer=self.output_frames,
+                start=True,
+            )
+
+        except Exception as e:
+            self.stop()
+            raise RuntimeError(f"Failed to start audio streams: {e}") from e
+
+        self._start_workers()
+
+    def stop(self) -> None:
+        """
+        Stop the audio interface and close its streams.
+
+        The PyAudio handle itself is kept alive so the interface can be
+        restarted cheaply; call close() to release it for good.
+        """
+        self.should_stop.set()
+        self._is_playing = False
+
+        self._stop_workers()
+        self._cleanup_streams()
+
+    def close(self) -> None:
+        """Stop the audio interface and release the PyAudio handle."""
+        self.stop()
+
+        if self.p:
+            try:
+                self.p.terminate()
+            except Exception as e:
+                log(f"Warning: Error terminating PyAudio: {e}")
+            self.p = None
+
+    def output(self, audio: bytes) -> None:
+        """
+        Output audio to the user.
+
+        Args:
+            audio: Audio data in 16-bit PCM mono format
+        """
+        # "is not None", not truthiness: the ring defines __len__, so an
+        # empty ring is falsy and a bare "if ring" would refuse the very
+        # first chunk of every session.
+        if not self.should_stop.is_set() and self.output_ring is not None:
+            if self.output_ring.put(audio):
+                self._is_playing = True
+            # Chunk is dropped when the ring is full
+
+    def interrupt(self) -> None:
+        """
+        Interruption signal to stop any audio output.
+
+        Clears the output ring to stop any audio that is currently playing.
+        """
+        self._is_playing = False
+        if self.output_ring is not None:
+            self.output_ring.clear()
+        # _pending is owned by the output callback; writing it from here
+        # could be overwritten by a callback mid-flight and replay stale
+        # audio. Hand the discard over instead.
+        self._drop_pending = True
+
+    def force_interrupt(self) -> None:
+        """Force interrupt the audio playback."""
+        self.interrupt()
+
+    def is_playing(self) -> bool:
+        """Check if audio is currently playing."""
+        return self._is_playing and (
+            not self.output_ring.empty() or bool(self._pending)
+        )
+
+    def clear_audio_buffer(self) -> None:
+        """Clear the audio output buffer."""
+        self.interrupt()
+
+    def _prepare_workers(self) -> None:
+        """Hook: allocate per-session state before the streams open."""
+
+    def _start_workers(self) -> None:
+        """Hook: start worker threads once the streams are live."""
+
+    def _stop_workers(self) -> None:
+        """Hook: join worker threads; should_stop is already set."""
+
+    def _process_output_chunk(self, chunk: bytes) -> bytes:
+        """Hook: transform one playback chunk inside the output callback."""
+        return chunk
+
+    def _handle_input(self, in_data: bytes) -> None:
+        """Forward one mic chunk to the user callback; subclasses may tee it."""
+        if self.input_callback:
+            try:
+                self.input_callback(in_data)
+            except Exception as e:
+                # Non-blocking: this runs inside the realtime callback
+                log(f"Input callback error: {e}")
+
+    def _cleanup_streams(self) -> None:
+        """Clean up audio streams safely."""
+        if self.in_stream:
+            try:
+                self.in_stream.stop_stream()
+                self.in_stream.close()
+            except Exception as e:
+                log(f"Warning: Error closing input stream: {e}")
+            self.in_stream = None
+
+        if self.out_stream:
+            try:
+                self.out_stream.stop_stream()
+                self.out_stream.close()
+            except Exception as e:
+                log(f"Warning: Error closing output stream: {e}")
+            self.out_stream = None
+
+    def _output_callback(
+        self, in_data: bytes, frame_count: int, time_info: dict, status: int
+    ) -> tuple:
+        """
+        Callback for the output audio stream.
+
+        Pulls frame_count frames from the ring without blocking, running
+        each dequeued chunk through _process_output_chunk and padding with
+        silence on underrun so playback simply goes quiet when the agent
+        has nothing queued.
+
+        Args:
+            in_data: Unused (output-only stream)
+            frame_count: Number of frames requested
+            time_info: Time information
+            status: Status code
+
+        Returns:
+            Tuple of (pcm_bytes, paContinue) to continue streaming
+        """
+        if self._drop_pending:
+            # interrupt() asked us to discard the leftover bytes; applied
+            # here so only the callback thread ever writes _pending.
+            self._drop_pending = False
+            self._pending = b""
+        needed = frame_count * 2  # 16-bit mono
+        pending = self._pending
+        while len(pending) < needed and self.output_ring is not None:
+            chunk = self.output_ring.get_nowait()
+            if chunk is None:
+                break
+            pending += self._process_output_chunk(chunk)
+
+        if len(pending) >= needed:
+            out = pending[:needed]
+            self._pending = pending[needed:]
+        else:
+            out = pending + b"\x00" * (needed - len(pending))
+            self._pending = b""
+            if not pending:
+                self._is_playing = False
+        return (out, self.pyaudio.paContinue)
+
+    def _input_callback(
+        self, in_data: bytes, frame_count: int, time_info: dict, status: int
+    ) -> tuple:
+        """
+        Callback for input audio stream.
+
+        Args:
+            in_data: Input audio data
+            frame_count: Number of frames
+            time_info: Time information
+            status: Status code
+
+        Returns:
+            Tuple of (None, paContinue) to continue streaming
+        """
+        if not self.should_stop.is_set() and in_data:
+            self._handle_input(in_data)
+        return (None, self.pyaudio.paContinue)
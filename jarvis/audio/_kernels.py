@@ -0,0 +1,159 @@
+"""
+Compiled audio kernels for the hot playback path.
+
+Numba is an optional accelerator: when it is installed the kernels below
+are JIT-compiled to tight native loops (and warmed at import time so the
+first audio chunk does not pay compile latency); otherwise equivalent
+vectorized NumPy fallbacks are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _vad_debounce_impl(prob: float, threshold: float, state: np.ndarray) -> int:
+    """
+    Advance the VAD debounce state machine by one frame.
+
+    state is int64[5]: (is_speaking, speech_run, silence_run,
+    min_speech_frames, min_silence_frames). Returns +1 on a
+    silence-to-speech edge, -1 on a speech-to-silence edge, 0 otherwise.
+    """
+    if prob > threshold:
+        state[1] += 1
+        state[2] = 0
+        if state[0] == 0 and state[1] >= state[3]:
+            state[0] = 1
+            return 1
+    else:
+        state[2] += 1
+        state[1] = 0
+        if state[0] == 1 and state[2] >= state[4]:
+            state[0] = 0
+            return -1
+    return 0
+
+
+def _frame_features_impl(buf: np.ndarray):
+    """
+    Accumulate energy and zero crossings over one float32 window.
+
+    Returns (energy, crossings); both feed the VAD front-end, so they are
+    fused into one pass over the window.
+    """
+    energy = 0.0
+    crossings = 0
+    prev_negative = buf[0] < 0.0
+    for i in range(buf.size):
+        v = buf[i]
+        energy += v * v
+        negative = v < 0.0
+        if negative != prev_negative:
+            crossings += 1
+            prev_negative = negative
+    return energy, crossings
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def scale_int16(src: np.ndarray, dst: np.ndarray, gain: float) -> None:
+        """Scale int16 samples by a gain with saturation, writing into dst."""
+        for i in range(src.size):
+            v = src[i] * gain
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            dst[i] = np.int16(v)
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def scale_ramp_int16(
+        src: np.ndarray, dst: np.ndarray, gain_start: float, gain_end: float
+    ) -> None:
+        """Scale int16 samples by a per-sample linear gain ramp into dst."""
+        n = src.size
+        step = (gain_end - gain_start) / (n - 1) if n > 1 else 0.0
+        g = gain_start
+        for i in range(n):
+            v = src[i] * g
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            dst[i] = np.int16(v)
+            g += step
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def pcm16_to_f32(src: np.ndarray, dst: np.ndarray) -> None:
+        """Convert int16 PCM to float32 in [-1, 1], writing into dst."""
+        inv = np.float32(1.0 / 32768.0)
+        for i in range(src.size):
+            dst[i] = src[i] * inv
+
+    vad_debounce = njit(cache=True, boundscheck=False)(_vad_debounce_impl)
+    frame_features = njit(cache=True, fastmath=True, boundscheck=False)(
+        _frame_features_impl
+    )
+
+    # Warm the JIT cache with a dummy chunk so the first real audio chunk
+    # does not block on compilation.
+    _warm_src = np.zeros(8, dtype=np.int16)
+    _warm_dst = np.zeros(8, dtype=np.int16)
+    scale_int16(_warm_src, _warm_dst, 0.5)
+    scale_ramp_int16(_warm_src, _warm_dst, 1.0, 0.5)
+    pcm16_to_f32(_warm_src, np.zeros(8, dtype=np.float32))
+    vad_debounce(0.0, 0.5, np.zeros(5, dtype=np.int64))
+    frame_features(np.zeros(8, dtype=np.float32))
+    del _warm_src, _warm_dst
+
+else:
+
+    # int32 scratch reused by the fallback scale kernel. The kernel is only
+    # ever called from the single audio output thread, so one shared scratch
+    # per process is safe.
+    _scale_scratch = np.empty(0, dtype=np.int32)
+
+    def scale_int16(src: np.ndarray, dst: np.ndarray, gain: float) -> None:
+        """Scale int16 samples by a gain with saturation, writing into dst.
+
+        Uses Q15 fixed-point with int32 intermediates so the whole pipeline
+        stays in integer SIMD and moves half the bytes of a float32 detour.
+        """
+        global _scale_scratch
+        if _scale_scratch.size < src.size:
+            _scale_scratch = np.empty(src.size, dtype=np.int32)
+        scratch = _scale_scratch[: src.size]
+        gain_q15 = np.int32(round(gain * 32768.0))
+        np.multiply(src, gain_q15, out=scratch)
+        np.right_shift(scratch, 15, out=scratch)
+        np.clip(scratch, -32768, 32767, out=scratch)
+        dst[:] = scratch
+
+    def scale_ramp_int16(
+        src: np.ndarray, dst: np.ndarray, gain_start: float, gain_end: float
+    ) -> None:
+        """Scale int16 samples by a per-sample linear gain ramp into dst."""
+        ramp = np.linspace(gain_start, gain_end, src.size, dtype=np.float32)
+        np.multiply(src, ramp, out=ramp)
+        np.clip(ramp, -32768.0, 32767.0, out=ramp)
+        dst[:] = ramp
+
+    def pcm16_to_f32(src: np.ndarray, dst: np.ndarray) -> None:
+        """Convert int16 PCM to float32 in [-1, 1], writing into dst."""
+        np.multiply(src, np.float32(1.0 / 32768.0), out=dst)
+
+    vad_debounce = _vad_debounce_impl
+
+    def frame_features(buf: np.ndarray):
+        """Accumulate energy and zero crossings over one float32 window."""
+        energy = float(np.dot(buf, buf))
+        signs = np.signbit(buf)
+        crossings = int(np.count_nonzero(signs[1:] != signs[:-1]))
+        return energy, crossings
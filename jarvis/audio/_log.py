@@ -0,0 +1,46 @@
+"""
+Non-blocking diagnostics for the audio threads.
+
+print() acquires the stdout lock and can block for milliseconds when
+stdout is a pipe — unacceptable from a realtime callback or the VAD
+loop. log() instead appends to a bounded deque (a GIL-atomic operation
+that never blocks) and a low-priority daemon thread drains it to
+stdout; when the ring overflows the oldest lines are dropped.
+"""
+
+import collections
+import threading
+
+_RING: "collections.deque[str]" = collections.deque(maxlen=256)
+_WAKE = threading.Event()
+_DRAINER_LOCK = threading.Lock()
+_drainer: "threading.Thread | None" = None
+
+
+def log(msg: str) -> None:
+    """Queue a diagnostic line for printing without blocking the caller."""
+    _RING.append(msg)
+    _WAKE.set()
+    if _drainer is None:
+        _ensure_drainer()
+
+
+def _ensure_drainer() -> None:
+    """Start the drain thread once, on first use."""
+    global _drainer
+    with _DRAINER_LOCK:
+        if _drainer is None:
+            _drainer = threading.Thread(target=_drain, daemon=True)
+            _drainer.start()
+
+
+def _drain() -> None:
+    """Print queued lines; the only thread here that touches stdout."""
+    while True:
+        _WAKE.wait()
+        _WAKE.clear()
+        while _RING:
+            try:
+                print(_RING.popleft())
+            except IndexError:
+                break
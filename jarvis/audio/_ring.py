@@ -0,0 +1,144 @@
+"""
+Lock-free single-producer/single-consumer ring for audio chunks.
+
+queue.Queue takes a mutex per put/get and drains interrupts with an O(n)
+get() spin loop. This ring relies on the GIL's atomic int loads/stores
+instead: the producer only advances the head counter, the consumer only
+advances the tail counter, and clearing records an O(1) watermark that
+the consumer applies on its next get.
+"""
+
+import threading
+from typing import Optional
+
+
+class AudioRing:
+    """
+    Fixed-capacity SPSC ring holding raw audio chunks.
+
+    Head and tail are monotonically increasing counters; slot indices are
+    derived modulo the capacity. A threading.Event provides the consumer
+    wakeup so the reader can block in C instead of polling.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Maximum number of queued chunks before puts are refused
+        """
+        self._slots: list = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # next write position, producer-owned
+        self._tail = 0  # next read position, consumer-owned
+        # Producer position snapshotted by clear(); the consumer jumps
+        # its tail forward to this watermark on its next get, so clear()
+        # never writes the consumer-owned counter from another thread.
+        self._clear_upto = 0
+        self._data_ready = threading.Event()
+
+    def put(self, chunk: bytes) -> bool:
+        """
+        Enqueue a chunk; returns False (dropping it) when the ring is full.
+
+        Args:
+            chunk: Audio data in 16-bit PCM mono format
+        """
+        if self._head - self._tail >= self._capacity:
+            return False
+        self._slots[self._head % self._capacity] = chunk
+        self._head += 1
+        self._data_ready.set()
+        return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Dequeue the next chunk, blocking up to timeout seconds.
+
+        Returns:
+            The next chunk, or None if the ring stayed empty
+        """
+        self._apply_clear()
+        if self._head == self._tail:
+            self._data_ready.clear()
+            # Re-check after clearing: the producer may have raced a put in
+            # between, in which case the event is set again already.
+            if self._head == self._tail and not self._data_ready.wait(timeout):
+                return None
+            self._apply_clear()
+            if self._head == self._tail:
+                return None
+        index = self._tail % self._capacity
+        chunk = self._slots[index]
+        self._slots[index] = None  # drop the reference promptly
+        self._tail += 1
+        return chunk
+
+    def get_nowait(self) -> Optional[bytes]:
+        """
+        Dequeue the next chunk without blocking.
+
+        Safe to call from a realtime audio callback: no locks, no waits.
+
+        Returns:
+            The next chunk, or None if the ring is empty
+        """
+        self._apply_clear()
+        if self._head == self._tail:
+            return None
+        index = self._tail % self._capacity
+        chunk = self._slots[index]
+        self._slots[index] = None
+        self._tail += 1
+        return chunk
+
+    def wake(self) -> None:
+        """
+        Wake a consumer blocked in get() without enqueuing data.
+
+        Used on shutdown so readers can block with no timeout instead of
+        polling: the woken get() finds the ring empty and returns None,
+        letting the caller re-check its stop flag.
+        """
+        self._data_ready.set()
+
+    def clear(self) -> None:
+        """
+        Discard all chunks queued so far, in O(1). Safe from any thread.
+
+        Only the watermark is written here; the consumer performs the
+        actual tail jump on its next get. Writing the tail directly from
+        an interrupt thread would race the consumer's non-atomic
+        ``self._tail += 1`` and could resurrect cleared chunks or skip
+        live ones. Chunks put after this call are kept.
+        """
+        self._clear_upto = self._head
+
+    def _apply_clear(self) -> None:
+        """Apply a pending clear(); must run on the consumer thread."""
+        upto = self._clear_upto
+        tail = self._tail
+        if tail < upto:
+            # Drop the skipped chunks' references. The span is at most
+            # capacity entries and, because the producer refuses puts
+            # beyond tail + capacity, none of these slots can be the
+            # producer's current write target.
+            for i in range(tail, upto):
+                self._slots[i % self._capacity] = None
+            self._tail = upto
+
+    def empty(self) -> bool:
+        """Check whether the ring has no queued (uncleared) chunks."""
+        tail = self._tail
+        upto = self._clear_upto
+        if upto > tail:
+            tail = upto
+        return self._head == tail
+
+    def __len__(self) -> int:
+        tail = self._tail
+        upto = self._clear_upto
+        if upto > tail:
+            tail = upto
+        return max(0, self._head - tail)
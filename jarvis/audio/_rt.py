@@ -0,0 +1,88 @@
+"""
+Real-time scheduling helpers for the audio worker threads.
+
+Priority elevation is strictly best-effort: it needs RT privileges on
+Linux (CAP_SYS_NICE or an rtprio limit) and falls back silently when the
+platform or permissions do not allow it.
+"""
+
+import ctypes
+import ctypes.util
+import sys
+
+# mach thread_policy_set constants (macOS)
+_THREAD_TIME_CONSTRAINT_POLICY = 2
+_THREAD_TIME_CONSTRAINT_POLICY_COUNT = 4
+
+
+def raise_rt_priority(period_ns: int = 0) -> bool:
+    """
+    Try to promote the calling thread to real-time priority.
+
+    Args:
+        period_ns: Nominal period of the thread's work in nanoseconds,
+                   used for the macOS time-constraint policy
+
+    Returns:
+        True if the priority change took effect, False otherwise
+    """
+    if sys.platform.startswith("linux"):
+        return _raise_rt_priority_linux()
+    if sys.platform == "darwin":
+        return _raise_rt_priority_macos(period_ns)
+    return False
+
+
+def _raise_rt_priority_linux() -> bool:
+    """SCHED_FIFO via os.sched_setscheduler; needs RT capabilities."""
+    import os
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        return True
+    except (AttributeError, PermissionError, OSError):
+        return False
+
+
+def _raise_rt_priority_macos(period_ns: int) -> bool:
+    """THREAD_TIME_CONSTRAINT_POLICY via mach thread_policy_set."""
+
+    class _TimeConstraintPolicy(ctypes.Structure):
+        _fields_ = [
+            ("period", ctypes.c_uint32),
+            ("computation", ctypes.c_uint32),
+            ("constraint", ctypes.c_uint32),
+            ("preemptible", ctypes.c_uint32),
+        ]
+
+    class _TimebaseInfo(ctypes.Structure):
+        _fields_ = [("numer", ctypes.c_uint32), ("denom", ctypes.c_uint32)]
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        timebase = _TimebaseInfo()
+        libc.mach_timebase_info(ctypes.byref(timebase))
+        if not timebase.denom:
+            return False
+
+        def ns_to_abs(ns: int) -> int:
+            return int(ns * timebase.denom / timebase.numer)
+
+        period = ns_to_abs(period_ns) if period_ns else ns_to_abs(10_000_000)
+        policy = _TimeConstraintPolicy(
+            period=period,
+            computation=period // 4,
+            constraint=period // 2,
+            preemptible=1,
+        )
+        thread_port = libc.mach_thread_self()
+        result = libc.thread_policy_set(
+            thread_port,
+            _THREAD_TIME_CONSTRAINT_POLICY,
+            ctypes.byref(policy),
+            _THREAD_TIME_CONSTRAINT_POLICY_COUNT,
+        )
+        return result == 0
+    except (OSError, AttributeError):
+        return False
@@ -0,0 +1,41 @@
+"""
+Canonical import point for the Jarvis audio interfaces.
+
+The implementations live in their own modules; this thin re-export keeps
+the historical ``jarvis.audio.interface`` import path working for callers
+that want all interfaces from one place. Resolution is lazy (PEP 562),
+so importing one interface does not drag in the others' dependency
+stacks — in particular torch, which only SileroVADAudioInterface needs.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Bind the names for pyflakes and type checkers without importing
+    # the implementation modules (and their dependencies) at runtime.
+    from .interruptible import InterruptibleAudioInterface
+    from .silero_vad import SileroVADAudioInterface
+    from .volume_reducing import VolumeReducingAudioInterface
+
+__all__ = [
+    "InterruptibleAudioInterface",
+    "VolumeReducingAudioInterface",
+    "SileroVADAudioInterface",
+]
+
+_MODULE_BY_NAME = {
+    "InterruptibleAudioInterface": ".interruptible",
+    "VolumeReducingAudioInterface": ".volume_reducing",
+    "SileroVADAudioInterface": ".silero_vad",
+}
+
+
+def __getattr__(name: str):
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
@@ -6,13 +6,28 @@ of clearing buffer when interrupted, allowing for more natural conversation flow
 """
 
 import threading
-import queue
 import platform
 import time
 import os
 from typing import Callable, Optional
+
+import numpy as np
 from elevenlabs.conversational_ai.conversation import AudioInterface
 
+from ._kernels import scale_int16, scale_ramp_int16
+from ._log import log
+from ._ring import AudioRing
+from ._rt import raise_rt_priority
+
+# Ring capacity in chunks: roughly two seconds of agent audio at 16kHz,
+# matching the bound used by the other interfaces. Excess chunks are
+# dropped rather than growing the backlog.
+OUTPUT_RING_CHUNKS = 32
+
+# The platform cannot change while the process runs, so the uname() call
+# behind platform.system() is paid once at import instead of per instance.
+_IS_MACOS = platform.system().lower() == "darwin"
+
 
 class VolumeReducingAudioInterface(AudioInterface):
     """
@@ -55,22 +70,35 @@ class VolumeReducingAudioInterface(AudioInterface):
         self.output_frames = output_frames
         self.volume_reduction_factor = max(0.0, min(1.0, volume_reduction_factor))
         self.fade_duration_ms = fade_duration_ms
+        # Fade span in nanoseconds, precomputed so the per-chunk fade
+        # math stays in integer arithmetic.
+        self._fade_duration_ns = fade_duration_ms * 1_000_000
 
-        self.is_macos = platform.system().lower() == "darwin"
+        self.is_macos = _IS_MACOS
         self.p: Optional[pyaudio.PyAudio] = None
         self.in_stream = None
         self.out_stream = None
         self.output_thread: Optional[threading.Thread] = None
         self.should_stop = threading.Event()
-        self.output_queue: Optional[queue.Queue[bytes]] = None
+        # Lock-free SPSC ring from the SDK's output() calls to the write
+        # thread; put/get are plain counter moves, clear is O(1).
+        self.output_ring: Optional[AudioRing] = None
         self.input_callback: Optional[Callable[[bytes], None]] = None
-        self._is_playing = False
-
-        # Volume control state
+        # True while the writer thread holds a dequeued chunk; together
+        # with the ring's emptiness this gives is_playing() without a
+        # producer-side flag that could go stale after the ring drains.
+        self._writing = False
+
+        # Volume control state. No lock: each field is a single reference
+        # rebound atomically under the GIL, writers publish
+        # _is_interrupted last, and readers tolerate one chunk of
+        # staleness (the fade simply starts a chunk later).
         self._is_interrupted = False
-        self._interrupt_start_time = 0.0
+        self._interrupt_start_ns = 0
         self._current_volume = 1.0
-        self._volume_lock = threading.Lock()
+
+        # Scratch buffer reused by the scale kernels on the output path.
+        self._scale_dst = np.empty(self.output_frames, dtype=np.int16)
 
         # macOS-specific environment variable to help with audio issues
         if self.is_macos:
@@ -90,7 +118,7 @@ class VolumeReducingAudioInterface(AudioInterface):
 
         # Audio output is buffered so we can handle interruptions.
         # Start a separate thread to handle writing to the output stream.
-        self.output_queue = queue.Queue()
+        self.output_ring = AudioRing(capacity=OUTPUT_RING_CHUNKS)
         self.should_stop.clear()
         self.output_thread = threading.Thread(target=self._output_thread, daemon=True)
 
@@ -132,7 +160,14 @@ class VolumeReducingAudioInterface(AudioInterface):
     def stop(self) -> None:
         """Stop the audio interface and clean up resources."""
         self.should_stop.set()
-        self._is_playing = False
+        self._writing = False
+
+        # Wake the writer thread out of its blocking ring get. The guard
+        # must be "is not None": the ring is normally empty (falsy) at
+        # shutdown, and skipping the wake leaves the writer blocked in an
+        # untimed get() for the full join timeout.
+        if self.output_ring is not None:
+            self.output_ring.wake()
 
         if self.output_thread and self.output_thread.is_alive():
             self.output_thread.join(timeout=2.0)
@@ -143,7 +178,7 @@ class VolumeReducingAudioInterface(AudioInterface):
             try:
                 self.p.terminate()
             except Exception as e:
-                print(f"Warning: Error terminating PyAudio: {e}")
+                log(f"Warning: Error terminating PyAudio: {e}")
             self.p = None
 
     def output(self, audio: bytes) -> None:
@@ -153,12 +188,12 @@ class VolumeReducingAudioInterface(AudioInterface):
         Args:
             audio: Audio data in 16-bit PCM mono format
         """
-        if not self.should_stop.is_set() and self.output_queue:
-            try:
-                self.output_queue.put(audio, timeout=0.1)
-                self._is_playing = True
-            except queue.Full:
-                pass  # Drop audio if queue is full
+        # "is not None", not truthiness: the ring defines __len__, so an
+        # empty ring is falsy and a bare "if ring" would refuse the very
+        # first chunk of every session.
+        if not self.should_stop.is_set() and self.output_ring is not None:
+            self.output_ring.put(audio)
+            # Chunk is dropped when the ring is full
 
     def interrupt(self) -> None:
         """
@@ -166,52 +201,84 @@ class VolumeReducingAudioInterface(AudioInterface):
 
         Reduces the volume of audio output instead of clearing the buffer.
         """
-        with self._volume_lock:
-            self._is_interrupted = True
-            self._interrupt_start_time = time.time()
-            print("Audio interrupted - reducing volume to allow user speech")
+        # Monotonic clock: fade timing must not jump with NTP wall-clock
+        # adjustments. The timestamp is published before the flag so the
+        # output thread never sees an interrupt without its start time.
+        self._interrupt_start_ns = time.monotonic_ns()
+        self._is_interrupted = True
+        log("Audio interrupted - reducing volume to allow user speech")
 
     def force_interrupt(self) -> None:
         """Force interrupt the audio playback by reducing volume."""
         self.interrupt()
 
     def is_playing(self) -> bool:
-        """Check if audio is currently playing."""
-        return self._is_playing and not self.output_queue.empty()
+        """
+        Check if audio is currently playing.
+
+        Lock-free: both the ring emptiness test and the writer flag are
+        GIL-atomic reads, and the state resets itself once the writer
+        drains the backlog.
+        """
+        if self._writing:
+            return True
+        return self.output_ring is not None and not self.output_ring.empty()
 
     def clear_audio_buffer(self) -> None:
-        """Clear the audio output buffer."""
-        if self.output_queue:
-            try:
-                while True:
-                    self.output_queue.get(block=False)
-            except queue.Empty:
-                pass
+        """Clear the audio output buffer in O(1)."""
+        if self.output_ring is not None:
+            self.output_ring.clear()
 
     def _apply_volume_reduction(self, audio: bytes) -> bytes:
         """
         Apply volume reduction to audio data.
 
+        While the fade is in progress the chunk is scaled by a linear gain
+        ramp so the transition to the reduced volume is smooth; once the
+        fade completes a single scalar multiply is used. Both paths run as
+        one vectorized NumPy operation per chunk.
+
         Args:
             audio: Audio data in 16-bit PCM format
 
         Returns:
             Audio data with volume reduction applied
         """
-        with self._volume_lock:
-            if self._current_volume == 1.0:
-                return audio
-
-            # Convert bytes to numpy array
-            import numpy as np
-
-            audio_array = np.frombuffer(audio, dtype=np.int16)
-
-            # Apply volume reduction
-            reduced_audio = (audio_array * self._current_volume).astype(np.int16)
-
-            # Convert back to bytes
-            return reduced_audio.tobytes()
+        # Fast path for the common case: not interrupted and at unity
+        # gain. Both reads are GIL-atomic, and a stale value only delays
+        # the fade by one chunk.
+        if not self._is_interrupted and self._current_volume == 1.0:
+            return audio
+
+        if self._is_interrupted:
+            elapsed_ns = time.monotonic_ns() - self._interrupt_start_ns
+            span = 1.0 - self.volume_reduction_factor
+            if elapsed_ns >= self._fade_duration_ns:
+                gain_start = gain_end = self.volume_reduction_factor
+            else:
+                chunk_ns = (len(audio) // 2) * 1_000_000_000 // self.sample_rate
+                gain_start = 1.0 - span * (elapsed_ns / self._fade_duration_ns)
+                gain_end = 1.0 - span * min(
+                    1.0, (elapsed_ns + chunk_ns) / self._fade_duration_ns
+                )
+            self._current_volume = gain_end
+        else:
+            gain_start = gain_end = self._current_volume
+
+        if gain_start == 1.0 and gain_end == 1.0:
+            return audio
+
+        samples = np.frombuffer(audio, dtype=np.int16)
+        if self._scale_dst.size < samples.size:
+            self._scale_dst = np.empty(samples.size, dtype=np.int16)
+        reduced = self._scale_dst[: samples.size]
+        if gain_start == gain_end:
+            # Steady-state path: hit for as long as the user keeps talking
+            scale_int16(samples, reduced, gain_start)
+        else:
+            # Mid-fade: fused per-sample gain ramp, one compiled pass
+            scale_ramp_int16(samples, reduced, gain_start, gain_end)
+        return reduced.tobytes()
 
     def _cleanup_streams(self) -> None:
         """Clean up audio streams safely."""
@@ -220,7 +287,7 @@ class VolumeReducingAudioInterface(AudioInterface):
                 self.in_stream.stop_stream()
                 self.in_stream.close()
             except Exception as e:
-                print(f"Warning: Error closing input stream: {e}")
+                log(f"Warning: Error closing input stream: {e}")
             self.in_stream = None
 
         if self.out_stream:
@@ -228,27 +295,59 @@ class VolumeReducingAudioInterface(AudioInterface):
                 self.out_stream.stop_stream()
                 self.out_stream.close()
             except Exception as e:
-                print(f"Warning: Error closing output stream: {e}")
+                log(f"Warning: Error closing output stream: {e}")
             self.out_stream = None
 
     def _output_thread(self) -> None:
         """Output thread that handles writing audio data to the output stream."""
+        # Best-effort realtime promotion (SCHED_FIFO on Linux, mach
+        # time-constraint on macOS) so playback is not preempted under
+        # load; silently skipped without the needed privileges.
+        raise_rt_priority(period_ns=int(self.output_frames / self.sample_rate * 1e9))
+
+        ring = self.output_ring
         while not self.should_stop.is_set():
             try:
-                if self.output_queue:
-                    audio = self.output_queue.get(timeout=0.25)
-                    if audio and self.out_stream and not self.should_stop.is_set():
-                        try:
-                            # Apply volume reduction if interrupted
-                            processed_audio = self._apply_volume_reduction(audio)
-                            self.out_stream.write(processed_audio)
-                        except Exception as e:
-                            print(f"Audio output error: {e}")
-                            break
-            except queue.Empty:
-                pass
+                # No timeout: stop() wakes the ring, so an idle writer
+                # sleeps in C instead of polling 4x/s
+                audio = ring.get()
+                if audio is None:
+                    continue
+                self._writing = True
+
+                # Coalesce any backlog into one buffer: volume is then
+                # applied in a single vectorized pass over the whole
+                # region and PortAudio gets one write instead of N.
+                # Capped so interrupts stay responsive: an uncapped join
+                # of a full ring would block in one multi-second write,
+                # during which a fade could not take effect.
+                if len(audio) < 16384:
+                    nxt = ring.get_nowait()
+                    if nxt is not None:
+                        parts = [audio, nxt]
+                        total = len(audio) + len(nxt)
+                        while total < 16384:
+                            nxt = ring.get_nowait()
+                            if nxt is None:
+                                break
+                            parts.append(nxt)
+                            total += len(nxt)
+                        audio = b"".join(parts)
+
+                if audio and self.out_stream and not self.should_stop.is_set():
+                    try:
+                        # Dominant path: no interrupt, unity gain - write
+                        # straight through without entering the volume code
+                        if not self._is_interrupted and self._current_volume == 1.0:
+                            self.out_stream.write(audio)
+                        else:
+                            self.out_stream.write(self._apply_volume_reduction(audio))
+                    except Exception as e:
+                        log(f"Audio output error: {e}")
+                        break
+                self._writing = False
             except Exception as e:
-                print(f"Unexpected error in output thread: {e}")
+                log(f"Unexpected error in output thread: {e}")
                 break
 
     def _input_callback(
@@ -270,7 +369,8 @@ class VolumeReducingAudioInterface(AudioInterface):
             try:
                 self.input_callback(in_data)
             except Exception as e:
-                print(f"Input callback error: {e}")
+                # Non-blocking: this runs inside the realtime callback
+                log(f"Input callback error: {e}")
         return (None, self.pyaudio.paContinue)
 
     def resume_normal_volume(self) -> None:
@@ -280,7 +380,6 @@ class VolumeReducingAudioInterface(AudioInterface):
         This method can be called when the user stops speaking to restore
         normal audio volume.
         """
-        with self._volume_lock:
-            self._is_interrupted = False
-            self._current_volume = 1.0
-            print("Audio volume restored to normal")
+        self._is_interrupted = False
+        self._current_volume = 1.0
+        log("Audio volume restored to normal")
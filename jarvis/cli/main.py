@@ -9,9 +9,6 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-from ..core.assistant import JarvisAssistant
-from ..core.config import Config
-
 
 def main(argv: Optional[list] = None) -> int:
     """
@@ -45,6 +42,11 @@ Examples:
 
     args = parser.parse_args(argv)
 
+    # Imported after argument parsing so --help/--version (and argument
+    # errors) do not pay for the elevenlabs/numpy import chain.
+    from ..core.assistant import JarvisAssistant
+    from ..core.config import Config
+
     try:
         # Load configuration
         config = Config.from_env(args.env)
@@ -5,8 +5,12 @@ Orchestrates the voice assistant functionality with proper error handling
 and resource management.
 """
 
+import os
+import select
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 from elevenlabs.client import ElevenLabs
 from elevenlabs.conversational_ai.conversation import Conversation
@@ -55,17 +59,22 @@ class JarvisAssistant:
             RuntimeError: If initialization fails
         """
         try:
-            # Initialize ElevenLabs client
-            self.elevenlabs = ElevenLabs(api_key=self.config.api_key)
-            print("✓ ElevenLabs client initialized successfully")
-
-            # Create audio interface
-            self.audio_interface = VolumeReducingAudioInterface(
-                sample_rate=self.config.sample_rate,
-                input_frames=self.config.input_frames_per_buffer,
-                output_frames=self.config.output_frames_per_buffer,
-            )
-            print("✓ Audio interface created successfully")
+            # The ElevenLabs client and the audio interface are
+            # independent, so build them in parallel: client setup can
+            # overlap the audio stack's import and buffer allocation work
+            # instead of running after it.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                eleven_future = executor.submit(ElevenLabs, api_key=self.config.api_key)
+                audio_future = executor.submit(
+                    VolumeReducingAudioInterface,
+                    sample_rate=self.config.sample_rate,
+                    input_frames=self.config.input_frames_per_buffer,
+                    output_frames=self.config.output_frames_per_buffer,
+                )
+                self.elevenlabs = eleven_future.result()
+                print("✓ ElevenLabs client initialized successfully")
+                self.audio_interface = audio_future.result()
+                print("✓ Audio interface created successfully")
 
             # Create conversation object
             self.conversation = Conversation(
@@ -100,24 +109,67 @@ class JarvisAssistant:
         if not self.conversation:
             raise RuntimeError("Assistant not initialized. Call initialize() first.")
 
+        # Shutdown signals are routed through a pipe via set_wakeup_fd
+        # for the duration of the session: the C-level signal handler
+        # writes the pipe even while a C extension call holds the main
+        # thread, so Ctrl+C is handled deterministically instead of
+        # waiting for the VM to dispatch a Python handler.
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_w, False)
+        old_sigint = signal.signal(signal.SIGINT, lambda sig, frame: None)
+        old_sigterm = signal.signal(signal.SIGTERM, lambda sig, frame: None)
+        old_wakeup_fd = signal.set_wakeup_fd(wakeup_w, warn_on_full_buffer=False)
+
+        result: dict = {}
+
+        def _wait_for_end() -> None:
+            try:
+                result["id"] = self.conversation.wait_for_session_end()
+            except Exception as e:
+                result["error"] = e
+            try:
+                os.write(wakeup_w, b"\x00")
+            except OSError:
+                pass  # run() already tore the pipe down
+
         try:
             print("Starting conversation session...")
             self.conversation.start_session()
             self.session_active = True
             print("✓ Conversation session started successfully")
 
-            conversation_id = self.conversation.wait_for_session_end()
+            waiter = threading.Thread(target=_wait_for_end, daemon=True)
+            waiter.start()
+
+            # Woken either by a signal or by the waiter thread once the
+            # session ends on its own.
+            select.select([wakeup_r], [], [])
+            os.read(wakeup_r, 64)
+
+            if "id" not in result and "error" not in result:
+                print("\nReceived shutdown signal, ending session...")
+                self.conversation.end_session()
+                waiter.join(timeout=5.0)
+
             self.session_active = False
+
+            if "error" in result:
+                print(f"Error during conversation session: {result['error']}")
+                return None
+
+            conversation_id = result.get("id")
             print(f"✓ Conversation ended. ID: {conversation_id}")
             return conversation_id
 
-        except KeyboardInterrupt:
-            print("\nReceived keyboard interrupt, shutting down...")
-            return None
         except Exception as e:
             print(f"Error during conversation session: {e}")
             return None
         finally:
+            signal.set_wakeup_fd(old_wakeup_fd)
+            signal.signal(signal.SIGINT, old_sigint)
+            signal.signal(signal.SIGTERM, old_sigterm)
+            os.close(wakeup_r)
+            os.close(wakeup_w)
             self.cleanup()
 
     def _on_input_detected(self) -> None:
@@ -5,13 +5,23 @@ Handles environment variables, platform-specific settings, and validation.
 """
 
 import os
-from typing import Optional
+from typing import Optional, Set
 from dataclasses import dataclass
 
+# .env files already parsed into os.environ this process; load_dotenv
+# re-reads and re-parses the file on every call otherwise, which adds up
+# for callers that rebuild Config on every reconnect.
+_LOADED_ENV_FILES: Set[str] = set()
 
-@dataclass
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration for Jarvis voice assistant."""
+    """
+    Configuration for Jarvis voice assistant.
+
+    Frozen: settings are read-only once constructed, so they can be
+    shared across threads without defensive copies.
+    """
 
     agent_id: str
     api_key: str
@@ -33,12 +43,13 @@ class Config:
         Raises:
             ValueError: If required environment variables are missing
         """
-        # Load .env file if specified
-        if env_file and os.path.exists(env_file):
+        # Load .env file if specified (once per file per process)
+        if env_file and env_file not in _LOADED_ENV_FILES and os.path.exists(env_file):
             try:
                 from dotenv import load_dotenv
 
                 load_dotenv(env_file)
+                _LOADED_ENV_FILES.add(env_file)
             except ImportError:
                 pass  # python-dotenv not available, continue with system env
 
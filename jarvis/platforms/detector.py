@@ -10,6 +10,11 @@ import os
 from typing import Optional
 from .handlers import InputHandler
 
+# Neither the OS nor the device-tree node can change while the process
+# runs, so both lookups are paid once at import instead of per instance.
+_SYSTEM = platform.system().lower()
+_HAS_DEVICE_TREE_MODEL = os.path.exists("/proc/device-tree/model")
+
 
 class PlatformDetector:
     """Detects the current platform and provides appropriate input methods."""
@@ -20,13 +25,11 @@ class PlatformDetector:
 
     def _detect_platform(self) -> str:
         """Detect the current platform."""
-        system = platform.system().lower()
-
-        if system == "darwin":
+        if _SYSTEM == "darwin":
             return "mac"
-        elif system == "linux":
+        elif _SYSTEM == "linux":
             # Check if we're on Raspberry Pi
-            if os.path.exists("/proc/device-tree/model"):
+            if _HAS_DEVICE_TREE_MODEL:
                 try:
                     with open("/proc/device-tree/model", "r") as f:
                         model = f.read().lower()
@@ -66,11 +66,9 @@ class MacInputHandler(InputHandler):
         try:
             import keyboard
 
-            def on_space_press():
-                print("Spacebar pressed! Interrupting agent speech...")
-                callback()
-
-            keyboard.on_press_key("space", lambda _: on_space_press())
+            # One thin lambda to drop the event argument; the assistant's
+            # own input callback already announces the interrupt.
+            keyboard.on_press_key("space", lambda _event: callback())
             self.keyboard = keyboard
             print("Keyboard handler setup: Press SPACEBAR to interrupt")
 
@@ -99,12 +97,10 @@ class PiInputHandler(InputHandler):
         try:
             from gpiozero import Button
 
-            def on_button_press():
-                print("Button pressed! Interrupting agent speech...")
-                callback()
-
+            # gpiozero accepts a zero-argument callable directly; no
+            # wrapper frame per button press.
             self.button = Button(17)
-            self.button.when_pressed = on_button_press
+            self.button.when_pressed = callback
             print("GPIO handler setup: Press button on GPIO17 to interrupt")
 
         except ImportError:
@@ -0,0 +1,72 @@
+"""
+Shared ElevenLabs setup for the manual test scripts.
+
+test_interrupt.py, test_default_audio.py and test_elevenlabs_minimal.py
+all repeated the same dotenv loading, client construction and
+Conversation wiring; this module holds the single copy so the heavy SDK
+imports and the client's connection setup happen in one place.
+"""
+
+import functools
+import os
+import sys
+
+from dotenv import load_dotenv
+
+
+def load_credentials():
+    """
+    Load AGENT_ID and ELEVENLABS_API_KEY from .env.local/environment.
+
+    Exits the script with an error message when either is missing.
+    """
+    load_dotenv(".env.local")
+
+    agent_id = os.getenv("AGENT_ID")
+    api_key = os.getenv("ELEVENLABS_API_KEY")
+
+    if not agent_id or not api_key:
+        print("Error: AGENT_ID and ELEVENLABS_API_KEY are required")
+        sys.exit(1)
+
+    return agent_id, api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_client(api_key):
+    """Create (once) and return the ElevenLabs client for this key."""
+    from elevenlabs.client import ElevenLabs
+
+    return ElevenLabs(api_key=api_key)
+
+
+def make_conversation(client, agent_id, api_key, audio_interface, callbacks=True):
+    """
+    Build a Conversation wired to the given audio interface.
+
+    Args:
+        client: ElevenLabs client instance
+        agent_id: Agent to converse with
+        api_key: API key (only used to decide requires_auth)
+        audio_interface: AudioInterface implementation to use
+        callbacks: Attach the standard transcript-printing callbacks
+    """
+    from elevenlabs.conversational_ai.conversation import Conversation
+
+    kwargs = {}
+    if callbacks:
+        kwargs = dict(
+            callback_agent_response=lambda response: print(f"Agent: {response}"),
+            callback_agent_response_correction=lambda original, corrected: print(
+                f"Agent: {original} -> {corrected}"
+            ),
+            callback_user_transcript=lambda transcript: print(f"User: {transcript}"),
+        )
+
+    return Conversation(
+        client,
+        agent_id,
+        requires_auth=bool(api_key),
+        audio_interface=audio_interface,
+        **kwargs,
+    )
@@ -9,7 +9,7 @@ import time
 import sys
 
 
-def test_pyaudio_installation():
+def check_pyaudio_installation():
     """Test if PyAudio is properly installed."""
     try:
         import pyaudio
@@ -22,41 +22,40 @@ def test_pyaudio_installation():
         return None
 
 
-def test_audio_devices(pyaudio):
+def check_audio_devices(pyaudio, p):
     """Test available audio devices."""
     try:
-        p = pyaudio.PyAudio()
-
         print(f"\nAvailable audio devices:")
         print(f"{'Device ID':<10} {'Name':<30} {'Input':<8} {'Output':<8}")
         print("-" * 60)
 
+        # One C call per device, collected up front; formatting then
+        # iterates the cached dicts instead of re-crossing into PortAudio.
+        device_infos = []
         for i in range(p.get_device_count()):
             try:
-                device_info = p.get_device_info_by_index(i)
-                name = (
-                    device_info["name"][:28] + "..."
-                    if len(device_info["name"]) > 30
-                    else device_info["name"]
-                )
-                inputs = device_info["maxInputChannels"]
-                outputs = device_info["maxOutputChannels"]
-                print(f"{i:<10} {name:<30} {inputs:<8} {outputs:<8}")
+                device_infos.append(p.get_device_info_by_index(i))
             except Exception as e:
-                print(f"{i:<10} Error getting device info: {e}")
+                device_infos.append(e)
+
+        for i, device_info in enumerate(device_infos):
+            if isinstance(device_info, Exception):
+                print(f"{i:<10} Error getting device info: {device_info}")
+                continue
+            inputs = device_info["maxInputChannels"]
+            outputs = device_info["maxOutputChannels"]
+            # :<30.30 pads and truncates in one step
+            print(f"{i:<10} {device_info['name']:<30.30} {inputs:<8} {outputs:<8}")
 
-        p.terminate()
         return True
     except Exception as e:
         print(f"✗ Error testing audio devices: {e}")
         return False
 
 
-def test_audio_streams(pyaudio):
+def check_audio_streams(pyaudio, p):
     """Test basic audio input/output streams."""
     try:
-        p = pyaudio.PyAudio()
-
         # Test input stream
         print("\nTesting input stream...")
         try:
@@ -91,14 +90,13 @@ def test_audio_streams(pyaudio):
             print(f"✗ Output stream creation failed: {e}")
             return False
 
-        p.terminate()
         return True
     except Exception as e:
         print(f"✗ Error testing audio streams: {e}")
         return False
 
 
-def test_audio_permissions():
+def check_audio_permissions(p):
     """Test audio permissions on macOS."""
     if platform.system().lower() == "darwin":
         print("\nOn macOS, please ensure:")
@@ -112,17 +110,11 @@ def test_audio_permissions():
 
         # Try to get default devices
         try:
-            import pyaudio
-
-            p = pyaudio.PyAudio()
-
             default_input = p.get_default_input_device_info()
             default_output = p.get_default_output_device_info()
 
             print(f"\nDefault input device: {default_input['name']}")
             print(f"Default output device: {default_output['name']}")
-
-            p.terminate()
         except Exception as e:
             print(f"Could not get default devices: {e}")
 
@@ -134,20 +126,27 @@ def main():
     print(f"Platform: {platform.system()} {platform.release()}")
 
     # Test PyAudio installation
-    pyaudio = test_pyaudio_installation()
+    pyaudio = check_pyaudio_installation()
     if not pyaudio:
         sys.exit(1)
 
-    # Test audio devices
-    if not test_audio_devices(pyaudio):
-        sys.exit(1)
+    # One PyAudio instance shared by every check: each init negotiates
+    # with the host audio daemon, so there is no reason to pay for it
+    # four times.
+    p = pyaudio.PyAudio()
+    try:
+        # Test audio devices
+        if not check_audio_devices(pyaudio, p):
+            sys.exit(1)
 
-    # Test audio streams
-    if not test_audio_streams(pyaudio):
-        sys.exit(1)
+        # Test audio streams
+        if not check_audio_streams(pyaudio, p):
+            sys.exit(1)
 
-    # Test permissions (macOS specific)
-    test_audio_permissions()
+        # Test permissions (macOS specific)
+        check_audio_permissions(p)
+    finally:
+        p.terminate()
 
     print("\n✓ All basic audio tests passed!")
     print("If you're still having issues, try:")
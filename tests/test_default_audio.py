@@ -4,23 +4,16 @@ Test script using a minimal audio interface similar to ElevenLabs default.
 This will help determine if the CFData error is in our custom audio interface or upstream.
 """
 
-import os
 import sys
 import signal
 import threading
-import queue
-from dotenv import load_dotenv
 from elevenlabs.conversational_ai.conversation import AudioInterface
 
-# Load environment variables
-load_dotenv(".env.local")
+from _elevenlabs_helpers import get_client, load_credentials, make_conversation
+from jarvis.audio._ring import AudioRing
+from jarvis.audio._rt import raise_rt_priority
 
-agent_id = os.getenv("AGENT_ID")
-api_key = os.getenv("ELEVENLABS_API_KEY")
-
-if not agent_id or not api_key:
-    print("Error: AGENT_ID and ELEVENLABS_API_KEY are required")
-    sys.exit(1)
+agent_id, api_key = load_credentials()
 
 
 # Create a minimal audio interface similar to ElevenLabs default
@@ -41,7 +34,9 @@ class MinimalAudioInterface(AudioInterface):
         self.input_callback = None
         self.output_thread = None
         self.should_stop = threading.Event()
-        self.output_queue = queue.Queue()
+        # Lock-free SPSC ring instead of queue.Queue: put/get are plain
+        # counter moves, so the hand-off takes no mutex per chunk.
+        self.output_ring = AudioRing(capacity=32)
 
     def start(self, input_callback):
         """Start the audio interface."""
@@ -70,14 +65,17 @@ class MinimalAudioInterface(AudioInterface):
                 start=True,
             )
 
-            # Create output stream
+            # Create output stream. start=False: the stream only begins
+            # running once the first chunk is ready, so the device does
+            # not sit in an underrun feeding silence while waiting for
+            # the agent's first audio.
             self.out_stream = self.p.open(
                 format=self.pyaudio.paInt16,
                 channels=1,
                 rate=16000,
                 output=True,
                 frames_per_buffer=output_frames,
-                start=True,
+                start=False,
             )
 
             print("✓ Minimal audio interface started successfully")
@@ -92,6 +90,9 @@ class MinimalAudioInterface(AudioInterface):
         print("Stopping minimal audio interface...")
         self.should_stop.set()
 
+        # Wake the writer thread out of its blocking ring get
+        self.output_ring.wake()
+
         if self.output_thread and self.output_thread.is_alive():
             self.output_thread.join(timeout=2.0)
 
@@ -119,34 +120,55 @@ class MinimalAudioInterface(AudioInterface):
             self.p = None
 
     def output(self, audio):
-        """Output audio data."""
+        """Output audio data (16-bit PCM mono bytes, end to end)."""
         if not self.should_stop.is_set():
-            try:
-                self.output_queue.put(audio, timeout=0.1)
-            except queue.Full:
-                pass  # Drop audio if queue is full
+            self.output_ring.put(audio)
+            # Chunk is dropped when the ring is full
 
     def interrupt(self):
         """Interrupt audio output."""
-        try:
-            while True:
-                self.output_queue.get(block=False)
-        except queue.Empty:
-            pass
+        self.output_ring.clear()
 
     def _output_thread(self):
         """Output thread."""
+        # Best-effort realtime promotion; silently skipped without the
+        # needed privileges, as in the production interfaces.
+        raise_rt_priority(period_ns=int(1024 / 16000 * 1e9))
+
+        stream_started = False
         while not self.should_stop.is_set():
             try:
-                audio = self.output_queue.get(timeout=0.25)
+                # No timeout: stop() wakes the ring, so an idle writer
+                # sleeps in C instead of waking 4x/s
+                audio = self.output_ring.get()
+                if audio is None:
+                    continue
+
+                # Coalesce any backlog into one buffer so PortAudio gets
+                # one write instead of N; capped so interrupts stay
+                # responsive.
+                if len(audio) < 16384:
+                    nxt = self.output_ring.get_nowait()
+                    if nxt is not None:
+                        parts = [audio, nxt]
+                        total = len(audio) + len(nxt)
+                        while total < 16384:
+                            nxt = self.output_ring.get_nowait()
+                            if nxt is None:
+                                break
+                            parts.append(nxt)
+                            total += len(nxt)
+                        audio = b"".join(parts)
+
                 if audio and self.out_stream and not self.should_stop.is_set():
                     try:
+                        if not stream_started:
+                            self.out_stream.start_stream()
+                            stream_started = True
                         self.out_stream.write(audio)
                     except Exception as e:
                         print(f"Audio output error: {e}")
                         break
-            except queue.Empty:
-                pass
             except Exception as e:
                 print(f"Unexpected error in output thread: {e}")
                 break
@@ -165,11 +187,8 @@ print("Testing with minimal audio interface...")
 print("=" * 60)
 
 try:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs.conversational_ai.conversation import Conversation
-
     # Initialize ElevenLabs client
-    elevenlabs = ElevenLabs(api_key=api_key)
+    elevenlabs = get_client(api_key)
     print("✓ ElevenLabs client initialized")
 
     # Create minimal audio interface
@@ -177,17 +196,7 @@ try:
     print("✓ Minimal audio interface created")
 
     # Create conversation with minimal audio interface
-    conversation = Conversation(
-        elevenlabs,
-        agent_id,
-        requires_auth=bool(api_key),
-        audio_interface=minimal_audio,
-        callback_agent_response=lambda response: print(f"Agent: {response}"),
-        callback_agent_response_correction=lambda original, corrected: print(
-            f"Agent: {original} -> {corrected}"
-        ),
-        callback_user_transcript=lambda transcript: print(f"User: {transcript}"),
-    )
+    conversation = make_conversation(elevenlabs, agent_id, api_key, minimal_audio)
     print("✓ Conversation with minimal audio interface created")
 
     def cleanup_handler(sig, frame):
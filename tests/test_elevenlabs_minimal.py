@@ -4,25 +4,15 @@ Minimal test to isolate CFData assertion error.
 This script tests ElevenLabs initialization without our custom audio interface.
 """
 
-import os
 import sys
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(".env.local")
+from _elevenlabs_helpers import get_client, load_credentials, make_conversation
 
-agent_id = os.getenv("AGENT_ID")
-api_key = os.getenv("ELEVENLABS_API_KEY")
-
-if not agent_id or not api_key:
-    print("Error: AGENT_ID and ELEVENLABS_API_KEY are required")
-    sys.exit(1)
+agent_id, api_key = load_credentials()
 
 print("Testing ElevenLabs client initialization...")
 try:
-    from elevenlabs.client import ElevenLabs
-
-    elevenlabs = ElevenLabs(api_key=api_key)
+    elevenlabs = get_client(api_key)
     print("✓ ElevenLabs client created successfully")
 except Exception as e:
     print(f"✗ ElevenLabs client creation failed: {e}")
@@ -30,7 +20,6 @@ except Exception as e:
 
 print("\nTesting conversation with default audio interface...")
 try:
-    from elevenlabs.conversational_ai.conversation import Conversation
     from elevenlabs.conversational_ai.conversation import AudioInterface
 
     # Create a minimal audio interface for testing
@@ -48,11 +37,8 @@ try:
             pass
 
     minimal_audio = MinimalAudioInterface()
-    conversation_with_default = Conversation(
-        elevenlabs,
-        agent_id,
-        requires_auth=bool(api_key),
-        audio_interface=minimal_audio,
+    conversation_with_default = make_conversation(
+        elevenlabs, agent_id, api_key, minimal_audio, callbacks=False
     )
     print("✓ Conversation with minimal audio interface created successfully")
 except Exception as e:
@@ -71,11 +57,8 @@ except Exception as e:
 
 print("\nTesting conversation with our custom audio interface...")
 try:
-    conversation_with_custom_audio = Conversation(
-        elevenlabs,
-        agent_id,
-        requires_auth=bool(api_key),
-        audio_interface=audio_interface,
+    conversation_with_custom_audio = make_conversation(
+        elevenlabs, agent_id, api_key, audio_interface, callbacks=False
     )
     print("✓ Conversation with custom audio interface created successfully")
 except Exception as e:
@@ -3,31 +3,21 @@
 Test script using the InterruptibleAudioInterface in the same context as the working minimal test.
 """
 
-import os
 import sys
 import signal
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(".env.local")
+from _elevenlabs_helpers import get_client, load_credentials, make_conversation
 
-agent_id = os.getenv("AGENT_ID")
-api_key = os.getenv("ELEVENLABS_API_KEY")
-
-if not agent_id or not api_key:
-    print("Error: AGENT_ID and ELEVENLABS_API_KEY are required")
-    sys.exit(1)
+agent_id, api_key = load_credentials()
 
 print("Testing with InterruptibleAudioInterface...")
 print("=" * 60)
 
 try:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs.conversational_ai.conversation import Conversation
     from interruptible_audio_interface import InterruptibleAudioInterface
 
     # Initialize ElevenLabs client
-    elevenlabs = ElevenLabs(api_key=api_key)
+    elevenlabs = get_client(api_key)
     print("✓ ElevenLabs client initialized")
 
     # Create interruptible audio interface
@@ -35,17 +25,7 @@ try:
     print("✓ InterruptibleAudioInterface created")
 
     # Create conversation with interruptible audio interface
-    conversation = Conversation(
-        elevenlabs,
-        agent_id,
-        requires_auth=bool(api_key),
-        audio_interface=audio_interface,
-        callback_agent_response=lambda response: print(f"Agent: {response}"),
-        callback_agent_response_correction=lambda original, corrected: print(
-            f"Agent: {original} -> {corrected}"
-        ),
-        callback_user_transcript=lambda transcript: print(f"User: {transcript}"),
-    )
+    conversation = make_conversation(elevenlabs, agent_id, api_key, audio_interface)
     print("✓ Conversation with InterruptibleAudioInterface created")
 
     def cleanup_handler(sig, frame):
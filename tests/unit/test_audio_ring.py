@@ -0,0 +1,67 @@
+"""
+Unit tests for the AudioRing SPSC buffer.
+"""
+
+from jarvis.audio._ring import AudioRing
+
+
+class TestAudioRing:
+    """Test cases for AudioRing, focused on the clear() handoff."""
+
+    def test_put_get_roundtrip(self):
+        """Test that chunks come back in FIFO order."""
+        ring = AudioRing(capacity=4)
+        assert ring.put(b"a")
+        assert ring.put(b"b")
+
+        assert ring.get_nowait() == b"a"
+        assert ring.get_nowait() == b"b"
+        assert ring.get_nowait() is None
+
+    def test_put_refused_when_full(self):
+        """Test that puts are refused (dropped) once capacity is reached."""
+        ring = AudioRing(capacity=2)
+        assert ring.put(b"a")
+        assert ring.put(b"b")
+        assert not ring.put(b"c")
+        assert len(ring) == 2
+
+    def test_clear_discards_backlog(self):
+        """Test that clear() makes queued chunks invisible immediately."""
+        ring = AudioRing(capacity=4)
+        ring.put(b"a")
+        ring.put(b"b")
+
+        ring.clear()
+
+        assert ring.empty()
+        assert len(ring) == 0
+        assert ring.get_nowait() is None
+
+    def test_clear_keeps_chunks_put_afterwards(self):
+        """Test that a chunk enqueued after clear() survives the clear.
+
+        The consumer applies the tail jump lazily, so the watermark must
+        not swallow audio produced after the interrupt.
+        """
+        ring = AudioRing(capacity=4)
+        ring.put(b"stale")
+        ring.clear()
+        ring.put(b"fresh")
+
+        assert not ring.empty()
+        assert ring.get_nowait() == b"fresh"
+        assert ring.get_nowait() is None
+
+    def test_clear_does_not_write_consumer_tail(self):
+        """Test that clear() leaves the tail jump to the consumer side."""
+        ring = AudioRing(capacity=4)
+        ring.put(b"a")
+
+        ring.clear()
+
+        # Only the watermark moved; the consumer-owned counter is
+        # untouched until the next get.
+        assert ring._tail == 0
+        assert ring.get_nowait() is None
+        assert ring._tail == 1
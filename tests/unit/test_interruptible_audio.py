@@ -0,0 +1,55 @@
+"""
+Unit tests for InterruptibleAudioInterface.
+"""
+
+import pytest
+
+from unittest.mock import patch
+from jarvis.audio.interface import InterruptibleAudioInterface
+from jarvis.audio._ring import AudioRing
+
+
+class TestInterruptibleAudioInterface:
+    """Test cases for InterruptibleAudioInterface class."""
+
+    @pytest.fixture(autouse=True)
+    def _mock_pyaudio(self):
+        """Patch PyAudio once per test instead of per with-block."""
+        with patch("pyaudio.PyAudio"):
+            yield
+
+    def test_output_enqueues_to_empty_ring(self):
+        """Test that output() enqueues onto a freshly created (empty) ring.
+
+        Regression test: the ring defines __len__, so an empty ring is
+        falsy and a truthiness guard in output() would silently drop
+        every chunk of a session.
+        """
+        interface = InterruptibleAudioInterface()
+        interface.output_ring = AudioRing()
+        assert interface.output_ring.empty()
+
+        interface.output(b"chunk")
+
+        assert not interface.output_ring.empty()
+        assert interface.output_ring.get_nowait() == b"chunk"
+
+    def test_output_without_ring_is_noop(self):
+        """Test that output() before start() drops audio without error."""
+        interface = InterruptibleAudioInterface()
+
+        interface.output(b"chunk")
+
+        assert not interface.is_playing()
+
+    def test_interrupt_clears_ring(self):
+        """Test that interrupt() discards queued audio and stops playback."""
+        interface = InterruptibleAudioInterface()
+        interface.output_ring = AudioRing()
+        interface.output(b"chunk")
+        assert interface.is_playing()
+
+        interface.interrupt()
+
+        assert interface.output_ring.empty()
+        assert not interface.is_playing()